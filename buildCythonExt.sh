@@ -0,0 +1,13 @@
+source ./setEnv.sh
+
+# ***** Build the optional Cython parsing extension
+run()
+{
+    echo ${grn}Building Cython parsing extension ...${end}
+    pip3 install --upgrade cython
+    python3 setup_cython.py build_ext --inplace
+    echo ${grn}Cython parsing extension built${end}
+}
+
+# ***** MAIN EXECUTION
+run
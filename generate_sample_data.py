@@ -2,8 +2,19 @@
 # This script generates sample fixed-width data for testing
 
 import os
+from functools import lru_cache
 from typing import List, Tuple
 
+
+@lru_cache(maxsize=4096)
+def _pad(value: str, length: int) -> str:
+    """Pad or truncate a value to the exact field length
+
+    Memoized: many field values (cities, codes, constant markers) repeat on
+    every record cycle, so the padded string is computed once and reused.
+    """
+    return value[:length].ljust(length)
+
 def create_sample_record(record_num: int = 1) -> str:
     """Create a sample fixed-width cliente record"""
     # Based on the field definitions, create a properly formatted record
@@ -54,14 +65,9 @@ def create_sample_record(record_num: int = 1) -> str:
         ('varie', f'Various information for record {record_num}', 255) # Alpha: Various
     ]
 
-    # Build the fixed-width record
-    record = ''
-    for field_name, value, length in fields_data:
-        # Pad or truncate the value to the exact field length
-        formatted_value = str(value)[:length].ljust(length)
-        record += formatted_value
-
-    return record
+    # Build the fixed-width record in a single join instead of growing a
+    # string field by field
+    return ''.join(_pad(str(value), length) for _, value, length in fields_data)
 
 def create_diverse_sample_records(num_records: int = 5) -> List[str]:
     """Create diverse sample records with varying data"""
@@ -147,13 +153,9 @@ def create_diverse_sample_records(num_records: int = 5) -> List[str]:
             ('varie', f'Record {record_num} - {name} {surname} from {city}', 255),
         ]
 
-        # Build the fixed-width record
-        record = ''
-        for field_name, value, length in fields_data:
-            formatted_value = str(value)[:length].ljust(length)
-            record += formatted_value
-
-        records.append(record)
+        # Build the fixed-width record in a single join
+        records.append(''.join(_pad(str(value), length)
+                               for _, value, length in fields_data))
 
     return records
 
@@ -166,8 +168,8 @@ def generate_sample_file(filename: str = 'sample_clienti.dat', num_records: int
         records = [create_sample_record(i + 1) for i in range(num_records)]
 
     with open(filename, 'w', encoding='utf-8') as f:
-        for record in records:
-            f.write(record + '\n')
+        # Single buffered write instead of one write per record
+        f.write('\n'.join(records) + '\n')
 
     print(f"Created sample file '{filename}' with {num_records} records")
     print(f"Each record is {len(records[0]) if records else 0} characters long")
@@ -0,0 +1,10 @@
+# Build script for the optional Cython parsing extension
+# Usage: ./buildCythonExt.sh (or: python3 setup_cython.py build_ext --inplace)
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='cliente_parser',
+    ext_modules=cythonize('cliente_parser.pyx', language_level=3),
+)